@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Optional
+
 from pydantic import Field, SecretStr,HttpUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -10,6 +13,7 @@ class APIKeysSettings(BaseSettings):
     llama_cloud_api_key: SecretStr = Field(..., description="LlamaCloud API Key", env="LLAMA_CLOUD_API_KEY")
     supabase_url: HttpUrl =  Field(..., description="Supabase Project URL", env="SUPABASE_URL")
     supabase_key: SecretStr =  Field(..., description="Supabase API Key", env="SUPABASE_KEY")
+    supabase_jwt_secret: Optional[SecretStr] = Field(None, description="Supabase JWT Secret (HS256 projects)", env="SUPABASE_JWT_SECRET")
     
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
@@ -18,6 +22,8 @@ class Settings(BaseSettings):
     """Main application settings."""
     project_name: str = "PDF RAG QA System"
     version: str = "0.1.0"
+    # Set ACCESS_LOG=false in production to skip per-request access logging
+    access_log: bool = True
 
     api_keys: APIKeysSettings = Field(default_factory=APIKeysSettings)
     
@@ -25,6 +31,24 @@ class Settings(BaseSettings):
     max_file_size_mb: int = 5
     allowed_mime_types: list[str] = ["application/pdf"]
     storage_bucket_name: str = "pdfs_files"
+    # Redirect downloads to a signed storage URL instead of proxying the file
+    download_via_signed_url: bool = True
+    signed_url_expires_seconds: int = 60
+    # How long a user's document list pages are served from memory
+    list_cache_ttl_seconds: int = 30
+
+    # Supabase client settings
+    supabase_timeout_seconds: int = 10
+
+    # CORS settings
+    cors_origins: list[str] = ["http://localhost:3000"]
+    cors_max_age_seconds: int = 86400
+
+    # Auth settings
+    jwks_cache_ttl_seconds: int = 600
+    # Minimum gap between JWKS fetches triggered by unknown key IDs
+    jwks_min_refresh_seconds: int = 30
+    token_cache_ttl_seconds: int = 60
 
 
     model_config = SettingsConfigDict(
@@ -36,5 +60,7 @@ class Settings(BaseSettings):
     )
 
 
-def get_settings():
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance (built once, then cached)."""
     return Settings()
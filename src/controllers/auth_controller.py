@@ -1,5 +1,4 @@
 from fastapi import HTTPException, status
-from typing import Dict, Any
 import logging
 
 from services.auth_service import AuthService
@@ -48,19 +47,19 @@ class AuthController:
             return AuthResponse(
                 access_token=session.access_token,
                 token_type="bearer",
-                expires_in=session.expires_in if hasattr(session, 'expires_in') else 3600,
+                expires_in=getattr(session, 'expires_in', 3600),
                 refresh_token=session.refresh_token,
-                user=UserInfo(
+                user=UserInfo.model_construct(
                     id=user.id,
                     email=user.email,
-                    created_at=user.created_at if hasattr(user, 'created_at') else None
+                    created_at=getattr(user, 'created_at', None)
                 )
             )
             
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Signup handler error: {str(e)}")
+            logger.error("Signup handler error: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to create account"
@@ -93,19 +92,19 @@ class AuthController:
             return AuthResponse(
                 access_token=session.access_token,
                 token_type="bearer",
-                expires_in=session.expires_in if hasattr(session, 'expires_in') else 3600,
+                expires_in=getattr(session, 'expires_in', 3600),
                 refresh_token=session.refresh_token,
-                user=UserInfo(
+                user=UserInfo.model_construct(
                     id=user.id,
                     email=user.email,
-                    created_at=user.created_at if hasattr(user, 'created_at') else None
+                    created_at=getattr(user, 'created_at', None)
                 )
             )
             
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Login handler error: {str(e)}")
+            logger.error("Login handler error: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Login failed"
@@ -126,34 +125,34 @@ class AuthController:
         """
         try:
             result = await self.auth_service.refresh_token(refresh_token)
-            session = result["session"]
             
-            # Get user info from new token
-            user_result = await self.auth_service.verify_token(session.access_token)
-            user = user_result["user"]
+            # The refreshed session already carries the user, no need to
+            # verify the new access token with another round trip
+            user = result["user"]
+            session = result["session"]
             
             return AuthResponse(
                 access_token=session.access_token,
                 token_type="bearer",
-                expires_in=session.expires_in if hasattr(session, 'expires_in') else 3600,
+                expires_in=getattr(session, 'expires_in', 3600),
                 refresh_token=session.refresh_token,
-                user=UserInfo(
+                user=UserInfo.model_construct(
                     id=user.id,
                     email=user.email,
-                    created_at=user.created_at if hasattr(user, 'created_at') else None
+                    created_at=getattr(user, 'created_at', None)
                 )
             )
             
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Token refresh handler error: {str(e)}")
+            logger.error("Token refresh handler error: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Failed to refresh token"
             )
     
-    async def handle_logout(self, token: str) -> Dict[str, str]:
+    async def handle_logout(self, token: str) -> dict[str, str]:
         """
         Handle user logout request.
         
@@ -168,6 +167,6 @@ class AuthController:
             return {"message": "Logged out successfully"}
             
         except Exception as e:
-            logger.error(f"Logout handler error: {str(e)}")
+            logger.error("Logout handler error: %s", e)
 
             return {"message": "Logged out successfully"}
@@ -1,16 +1,18 @@
 from fastapi import UploadFile, HTTPException
-from typing import Dict, Any, Optional
+from fastapi.responses import Response, RedirectResponse, StreamingResponse
+from typing import Any
 import logging
 
 from services.document_service import DocumentService
+from config.settings import get_settings
 from models.schemas import (
     DocumentUploadResponse,
-    DocumentResponse,
-    DocumentListResponse,
-    DocumentDeleteResponse
+    DocumentDeleteResponse,
+    BulkDeleteResponse
 )
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 
 class DocumentController:
@@ -23,46 +25,23 @@ class DocumentController:
         self,
         file: UploadFile,
         user_id: str,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: dict[str, Any] | None = None
     ) -> DocumentUploadResponse:
         """Handle document upload request."""
         try:
             document = await self.service.upload_document(file, user_id, metadata)
             
-            return DocumentUploadResponse(
-                document_id=document["id"],
-                file_name=document["file_name"],
-                status=document["status"],
-                bucket_path=document["bucket_path"],
-                created_at=document["created_at"],
+            return DocumentUploadResponse.from_record(
+                document,
                 message="Upload successful. Document is pending processing."
             )
             
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Upload handler error: {str(e)}")
+            logger.error("Upload handler error: %s", e)
             raise HTTPException(status_code=500, detail="Upload failed")
     
-    def handle_get(self, document_id: str, user_id: str) -> DocumentResponse:
-        """Handle get document request."""
-        document = self.service.get_document(document_id, user_id)
-        return DocumentResponse(**document)
-    
-    def handle_list(
-        self,
-        user_id: str,
-        limit: int = 100,
-        offset: int = 0
-    ) -> DocumentListResponse:
-        """Handle list documents request."""
-        documents, total = self.service.list_documents(user_id, limit, offset)
-        
-        return DocumentListResponse(
-            documents=[DocumentResponse(**doc) for doc in documents],
-            total=total
-        )
-    
     async def handle_delete(
         self,
         document_id: str,
@@ -76,14 +55,39 @@ class DocumentController:
             document_id=document_id
         )
     
-    def handle_download(self, document_id: str, user_id: str) -> tuple[bytes, str]:
+    async def handle_bulk_delete(
+        self,
+        document_ids: list[str],
+        user_id: str
+    ) -> BulkDeleteResponse:
+        """Handle bulk delete request."""
+        deleted_ids = await self.service.delete_many(document_ids, user_id)
+        
+        return BulkDeleteResponse.model_construct(
+            message=f"{len(deleted_ids)} document(s) deleted",
+            deleted_ids=deleted_ids
+        )
+    
+    async def handle_download(self, document_id: str, user_id: str) -> Response:
         """
         Handle download document request.
         
         Returns:
-            Tuple of (file_bytes, filename)
+            RedirectResponse to a short-lived signed storage URL, or a
+            StreamingResponse relaying the PDF when redirects are disabled
         """
-        document = self.service.get_document(document_id, user_id)
-        file_bytes = self.service.download_document(document_id, user_id)
+        if settings.download_via_signed_url:
+            url = await self.service.create_download_url(
+                document_id,
+                user_id,
+                expires_in=settings.signed_url_expires_seconds
+            )
+            return RedirectResponse(url, status_code=307)
+        
+        chunks, filename = await self.service.stream_download(document_id, user_id)
         
-        return file_bytes, document["file_name"]
+        return StreamingResponse(
+            chunks,
+            media_type="application/pdf",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
@@ -1,19 +1,64 @@
-from supabase import create_client, Client
+from typing import Optional
+import asyncio
+
+import httpx
+from supabase import acreate_client, AsyncClient, AsyncClientOptions
 from config.settings import get_settings
 
-settings = get_settings()  
+settings = get_settings()
 
 class DBConnection:
-    def __init__(self):
-        self.client: Client = create_client(
-            supabase_url=str(settings.api_keys.supabase_url),
-            supabase_key=settings.api_keys.supabase_key.get_secret_value()
-        )
+    """Process-wide Supabase client sharing one pooled HTTP client."""
 
-    def get_client(self) -> Client:
-        return self.client
+    _instance: Optional["DBConnection"] = None
+    _lock = asyncio.Lock()
 
+    def __init__(self, client: AsyncClient, http_client: httpx.AsyncClient):
+        self.client = client
+        self.http_client = http_client
 
-db = DBConnection().get_client()
+    @classmethod
+    async def get_instance(cls) -> "DBConnection":
+        # The async client can only be built inside a running event loop,
+        # so it is created on first use and then reused.
+        if cls._instance is None:
+            async with cls._lock:
+                if cls._instance is None:
+                    cls._instance = await cls._connect()
+        return cls._instance
 
+    @classmethod
+    async def _connect(cls) -> "DBConnection":
+        # PostgREST, Storage and Auth all share this client, so TLS
+        # connections are kept alive and reused across requests; HTTP/2
+        # multiplexes concurrent calls over the same connection.
+        http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=settings.supabase_timeout_seconds,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=50,
+                keepalive_expiry=30
+            )
+        )
+        client = await acreate_client(
+            supabase_url=str(settings.api_keys.supabase_url),
+            supabase_key=settings.api_keys.supabase_key.get_secret_value(),
+            options=AsyncClientOptions(
+                postgrest_client_timeout=settings.supabase_timeout_seconds,
+                storage_client_timeout=settings.supabase_timeout_seconds,
+                httpx_client=http_client
+            )
+        )
+        return cls(client, http_client)
+
+    def get_client(self) -> AsyncClient:
+        return self.client
 
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared HTTP connection pool."""
+        if cls._instance is not None:
+            await cls._instance.http_client.aclose()
+            cls._instance = None
@@ -1,8 +1,17 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager
 import logging
 
 from config.settings import get_settings
+from db.supabase_client import DBConnection
+from controllers.auth_controller import AuthController
+from controllers.document_controller import DocumentController
+from services.auth_service import AuthService
+from services.document_service import DocumentService
+from services.jwt_verifier import build_jwt_verifier
+from utils.upload_limit import UploadSizeLimitMiddleware
 from routes.auth import router as auth_router
 from routes.documents import router as documents_router
 
@@ -16,22 +25,61 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+if not settings.access_log:
+    logging.getLogger("uvicorn.access").disabled = True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared clients and warm caches before serving requests."""
+    db = await DBConnection.get_instance()
+    
+    # Shared across requests; dependencies read these from app.state
+    verifier = build_jwt_verifier(db.http_client)
+    app.state.auth_service = AuthService(db.client, verifier)
+    app.state.document_service = DocumentService(db.client, db.http_client)
+    app.state.auth_controller = AuthController(app.state.auth_service)
+    app.state.document_controller = DocumentController(app.state.document_service)
+    
+    try:
+        await verifier.refresh_keys()
+    except Exception as e:
+        logger.warning("Could not prefetch JWKS, will retry on first request: %s", e)
+    
+    # Build the OpenAPI schema (and all model JSON schemas) up front
+    app.openapi()
+    
+    logger.info("Startup complete")
+    yield
+    
+    await DBConnection.close()
+
 
 app = FastAPI(
     title=settings.project_name,
     version=settings.version,
     description="Retrieval-Augmented Generation system for intelligent question answering over PDF documents",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    path="/documents/upload",
+    max_size_mb=settings.max_file_size_mb,
+)
+
+# Added last so it wraps the other middleware (413s still get CORS headers)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["authorization", "content-type"],
+    max_age=settings.cors_max_age_seconds,
 )
 
 app.include_router(auth_router)
@@ -56,4 +104,4 @@ def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0")
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", access_log=settings.access_log)
\ No newline at end of file
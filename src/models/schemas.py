@@ -1,30 +1,62 @@
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, EmailStr, Field, StringConstraints, AfterValidator
 from datetime import datetime
-from typing import Optional, Any
-import re
+from uuid import UUID
+from typing import Annotated, Optional, Any
+import string
+
+
+# Password character classes; digits are checked with str.isdecimal() like \d
+_PW_UPPER = frozenset(string.ascii_uppercase)
+_PW_LOWER = frozenset(string.ascii_lowercase)
+_PW_SPECIAL = frozenset('!@#$%^&*(),.?":{}|<>')
+
+_HAS_UPPER, _HAS_LOWER, _HAS_DIGIT, _HAS_SPECIAL = 1, 2, 4, 8
+_HAS_ALL = _HAS_UPPER | _HAS_LOWER | _HAS_DIGIT | _HAS_SPECIAL
+
+
+def _parse_timestamp(value: Any) -> Any:
+    """Parse an ISO-8601 timestamp string as returned by PostgREST."""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _validate_password_strength(v: str) -> str:
+    """Validate password meets security requirements."""
+    # Single pass over the password collecting one bit per character class
+    mask = 0
+    for c in v:
+        if c in _PW_UPPER:
+            mask |= _HAS_UPPER
+        elif c in _PW_LOWER:
+            mask |= _HAS_LOWER
+        elif c.isdecimal():
+            mask |= _HAS_DIGIT
+        elif c in _PW_SPECIAL:
+            mask |= _HAS_SPECIAL
+    
+    if mask != _HAS_ALL:
+        if not mask & _HAS_UPPER:
+            raise ValueError('Password must contain at least one uppercase letter')
+        if not mask & _HAS_LOWER:
+            raise ValueError('Password must contain at least one lowercase letter')
+        if not mask & _HAS_DIGIT:
+            raise ValueError('Password must contain at least one number')
+        raise ValueError('Password must contain at least one special character')
+    return v
+
+
+# Length is enforced by pydantic-core; the class checks run once afterwards
+PasswordStr = Annotated[
+    str,
+    StringConstraints(min_length=8),
+    AfterValidator(_validate_password_strength)
+]
 
 
 # Auth schemas
 class SignupRequest(BaseModel):
     """Request model for user signup."""
     email: EmailStr = Field(..., description="User email address")
-    password: str = Field(..., min_length=8, description="User password (min 8 characters)")
-    
-    @field_validator('password')
-    @classmethod
-    def validate_password_strength(cls, v: str) -> str:
-        """Validate password meets security requirements."""
-        if len(v) < 8:
-            raise ValueError('Password must be at least 8 characters long')
-        if not re.search(r'[A-Z]', v):
-            raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
-            raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
-            raise ValueError('Password must contain at least one number')
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError('Password must contain at least one special character')
-        return v
+    password: PasswordStr = Field(..., description="User password (min 8 characters)")
 
 
 class LoginRequest(BaseModel):
@@ -83,6 +115,20 @@ class DocumentResponse(BaseModel):
     metadata: dict[str, Any] = {}
     created_at: datetime
     updated_at: datetime
+    
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> "DocumentResponse":
+        """Build from a trusted database row, skipping field validation."""
+        return cls.model_construct(
+            id=record["id"],
+            user_id=record["user_id"],
+            file_name=record["file_name"],
+            bucket_path=record["bucket_path"],
+            status=record["status"],
+            metadata=record.get("metadata") or {},
+            created_at=_parse_timestamp(record["created_at"]),
+            updated_at=_parse_timestamp(record["updated_at"])
+        )
 
 
 class DocumentListResponse(BaseModel):
@@ -100,8 +146,31 @@ class DocumentUploadResponse(BaseModel):
     created_at: datetime
     message: str = "Upload successful"
 
+    @classmethod
+    def from_record(cls, record: dict[str, Any], message: str) -> "DocumentUploadResponse":
+        """Build from the created database row, skipping field validation."""
+        return cls.model_construct(
+            document_id=record["id"],
+            file_name=record["file_name"],
+            status=record["status"],
+            bucket_path=record["bucket_path"],
+            created_at=_parse_timestamp(record["created_at"]),
+            message=message
+        )
+
 
 class DocumentDeleteResponse(BaseModel):
     """Response after deletion."""
     message: str
     document_id: str
+
+
+class BulkDeleteRequest(BaseModel):
+    """Request to delete several documents."""
+    document_ids: list[UUID] = Field(..., min_length=1, max_length=100, description="Document IDs to delete")
+
+
+class BulkDeleteResponse(BaseModel):
+    """Response after bulk deletion."""
+    message: str
+    deleted_ids: list[str]
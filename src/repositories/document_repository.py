@@ -1,5 +1,6 @@
-from supabase import Client
-from typing import Optional, Dict, Any
+from supabase import AsyncClient
+from postgrest.types import ReturnMethod
+from typing import Any
 import logging
 
 logger = logging.getLogger(__name__)
@@ -8,17 +9,17 @@ logger = logging.getLogger(__name__)
 class DocumentRepository:
     """Repository for document database operations."""
     
-    def __init__(self, supabase: Client):
+    def __init__(self, supabase: AsyncClient):
         self.db = supabase
     
-    def create(
+    async def create(
         self,
         document_id: str,
         user_id: str,
         file_name: str,
         bucket_path: str,
-        metadata: Dict[str, Any] = None
-    ) -> Dict[str, Any]:
+        metadata: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         """
         Create new document record.
         
@@ -42,7 +43,7 @@ class DocumentRepository:
                 "metadata": metadata or {}
             }
             
-            result = self.db.table("documents").insert(data).execute()
+            result = await self.db.table("documents").insert(data).execute()
             
             if not result.data:
                 raise Exception("Failed to create document record")
@@ -50,10 +51,53 @@ class DocumentRepository:
             return result.data[0]
             
         except Exception as e:
-            logger.error(f"Error creating document: {str(e)}")
+            logger.error("Error creating document: %s", e)
             raise
-    
-    def get_by_id(self, document_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+
+    async def create_many(
+        self,
+        rows: list[dict[str, Any]],
+        return_records: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Create several document records in a single bulk insert.
+
+        Args:
+            rows: Records with keys id, user_id, file_name, bucket_path
+                and optional metadata
+            return_records: Whether PostgREST should send the created
+                records back (skip for bulk ingestion)
+
+        Returns:
+            Created document records, or an empty list if not requested
+        """
+        try:
+            data = [
+                {
+                    "id": row["id"],
+                    "user_id": row["user_id"],
+                    "file_name": row["file_name"],
+                    "bucket_path": row["bucket_path"],
+                    "status": "pending",
+                    "metadata": row.get("metadata") or {}
+                }
+                for row in rows
+            ]
+
+            result = await self.db.table("documents")\
+                .insert(
+                    data,
+                    returning=ReturnMethod.representation if return_records else ReturnMethod.minimal
+                )\
+                .execute()
+
+            return result.data if return_records else []
+
+        except Exception as e:
+            logger.error("Error creating documents: %s", e)
+            raise
+
+    async def get_by_id(self, document_id: str, user_id: str) -> dict[str, Any] | None:
         """
         Get document by ID (with ownership check via RLS).
         
@@ -65,7 +109,7 @@ class DocumentRepository:
             Document record or None
         """
         try:
-            result = self.db.table("documents")\
+            result = await self.db.table("documents")\
                 .select("*")\
                 .eq("id", document_id)\
                 .execute()
@@ -73,15 +117,15 @@ class DocumentRepository:
             return result.data[0] if result.data else None
             
         except Exception as e:
-            logger.error(f"Error fetching document: {str(e)}")
+            logger.error("Error fetching document: %s", e)
             return None
     
-    def list_by_user(
+    async def list_by_user(
         self,
         user_id: str,
         limit: int = 100,
         offset: int = 0
-    ) -> tuple[list[Dict[str, Any]], int]:
+    ) -> tuple[list[dict[str, Any]], int]:
         """
         List all documents for a user.
         
@@ -94,29 +138,23 @@ class DocumentRepository:
             Tuple of (documents, total_count)
         """
         try:
-           
-            result = self.db.table("documents")\
-                .select("*")\
+            # One request returns both the page and the exact total count
+            result = await self.db.table("documents")\
+                .select("*", count="exact")\
                 .eq("user_id", user_id)\
                 .order("created_at", desc=True)\
                 .range(offset, offset + limit - 1)\
                 .execute()
             
-            
-            count_result = self.db.table("documents")\
-                .select("id", count="exact")\
-                .eq("user_id", user_id)\
-                .execute()
-            
-            total = count_result.count if count_result.count else 0
+            total = result.count if result.count else 0
             
             return result.data, total
             
         except Exception as e:
-            logger.error(f"Error listing documents: {str(e)}")
+            logger.error("Error listing documents: %s", e)
             return [], 0
     
-    def delete(self, document_id: str, user_id: str) -> bool:
+    async def delete(self, document_id: str, user_id: str) -> bool:
         """
         Delete document record (RLS ensures ownership).
         
@@ -128,7 +166,7 @@ class DocumentRepository:
             True if deleted, False otherwise
         """
         try:
-            result = self.db.table("documents")\
+            result = await self.db.table("documents")\
                 .delete()\
                 .eq("id", document_id)\
                 .execute()
@@ -136,14 +174,70 @@ class DocumentRepository:
             return len(result.data) > 0
             
         except Exception as e:
-            logger.error(f"Error deleting document: {str(e)}")
+            logger.error("Error deleting document: %s", e)
             return False
     
-    def update_status(
+    async def list_paths_by_ids(
+        self,
+        document_ids: list[str],
+        user_id: str
+    ) -> dict[str, str]:
+        """
+        Get storage paths for several documents in one query.
+        
+        Args:
+            document_ids: Document UUIDs
+            user_id: User UUID (only this user's documents are returned)
+            
+        Returns:
+            Mapping of document ID to bucket path for the documents found
+            
+        Raises:
+            Exception: If the query fails (so callers don't mistake an
+                outage for "no such documents")
+        """
+        try:
+            result = await self.db.table("documents")\
+                .select("id, bucket_path")\
+                .eq("user_id", user_id)\
+                .in_("id", document_ids)\
+                .execute()
+            
+            return {row["id"]: row["bucket_path"] for row in result.data}
+            
+        except Exception as e:
+            logger.error("Error fetching document paths: %s", e)
+            raise
+    
+    async def delete_many(self, document_ids: list[str], user_id: str) -> list[str]:
+        """
+        Delete several document records in one query.
+        
+        Args:
+            document_ids: Document UUIDs
+            user_id: User UUID (only this user's documents are deleted)
+            
+        Returns:
+            IDs of the deleted documents
+        """
+        try:
+            result = await self.db.table("documents")\
+                .delete()\
+                .eq("user_id", user_id)\
+                .in_("id", document_ids)\
+                .execute()
+            
+            return [row["id"] for row in result.data]
+            
+        except Exception as e:
+            logger.error("Error deleting documents: %s", e)
+            return []
+    
+    async def update_status(
         self,
         document_id: str,
         status: str,
-        error_message: Optional[str] = None
+        error_message: str | None = None
     ) -> bool:
         """
         Update document status.
@@ -162,7 +256,7 @@ class DocumentRepository:
             if error_message:
                 data["metadata"] = {"error": error_message}
             
-            result = self.db.table("documents")\
+            result = await self.db.table("documents")\
                 .update(data)\
                 .eq("id", document_id)\
                 .execute()
@@ -170,5 +264,5 @@ class DocumentRepository:
             return len(result.data) > 0
             
         except Exception as e:
-            logger.error(f"Error updating document status: {str(e)}")
+            logger.error("Error updating document status: %s", e)
             return False
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from typing import Dict
 
 from models.schemas import (
@@ -9,17 +9,14 @@ from models.schemas import (
     ErrorResponse
 )
 from controllers.auth_controller import AuthController
-from services.auth_service import AuthService
-from utils.dependencies import get_auth_service, get_current_user
+from utils.dependencies import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
-def get_auth_controller(
-    auth_service: AuthService = Depends(get_auth_service)
-) -> AuthController:
-    """Dependency to get AuthController instance."""
-    return AuthController(auth_service)
+async def get_auth_controller(request: Request) -> AuthController:
+    """Dependency to get the shared AuthController created at startup."""
+    return request.app.state.auth_controller
 
 
 @router.post(
@@ -51,12 +48,12 @@ async def signup(
 
 @router.post(
     "/login",
-    response_model=AuthResponse,
+    response_model=None,
     status_code=status.HTTP_200_OK,
     summary="Login user",
     description="Authenticate user with email and password to receive JWT tokens.",
     responses={
-        200: {"description": "Login successful"},
+        200: {"model": AuthResponse, "description": "Login successful"},
         401: {"model": ErrorResponse, "description": "Invalid credentials"},
         500: {"model": ErrorResponse, "description": "Internal server error"}
     }
@@ -76,12 +73,12 @@ async def login(
 
 @router.post(
     "/refresh",
-    response_model=AuthResponse,
+    response_model=None,
     status_code=status.HTTP_200_OK,
     summary="Refresh access token",
     description="Get a new access token using a refresh token.",
     responses={
-        200: {"description": "Token refreshed successfully"},
+        200: {"model": AuthResponse, "description": "Token refreshed successfully"},
         401: {"model": ErrorResponse, "description": "Invalid refresh token"},
         500: {"model": ErrorResponse, "description": "Internal server error"}
     }
@@ -137,7 +134,7 @@ async def get_me(
     Get current authenticated user information.
     
     Requires valid JWT token in Authorization header.
-    Returns user ID, email, and account creation date.
+    Returns user ID and email (as carried by the access token).
     """
     return {
         "user": current_user,
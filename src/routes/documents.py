@@ -1,43 +1,45 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Request, UploadFile, File, Form, Query
 from typing import Optional
 import json
-import io
 
 from controllers.document_controller import DocumentController
 from services.document_service import DocumentService
-from utils.dependencies import get_current_user, get_supabase_client
+from utils.dependencies import get_current_user
 from models.schemas import (
     DocumentUploadResponse,
     DocumentResponse,
     DocumentListResponse,
     DocumentDeleteResponse,
+    BulkDeleteRequest,
+    BulkDeleteResponse,
     ErrorResponse
 )
 
 router = APIRouter(prefix="/documents", tags=["Documents"])
 
+# Routes return response models built without re-validation, so they
+# use response_model=None to skip FastAPI's second validation pass; the
+# models are still listed in `responses` for the OpenAPI schema.
 
-def get_document_service(supabase=Depends(get_supabase_client)) -> DocumentService:
-    """Dependency to get DocumentService."""
-    return DocumentService(supabase)
 
+async def get_document_service(request: Request) -> DocumentService:
+    """Dependency to get the shared DocumentService created at startup."""
+    return request.app.state.document_service
 
-def get_document_controller(
-    service: DocumentService = Depends(get_document_service)
-) -> DocumentController:
-    """Dependency to get DocumentController."""
-    return DocumentController(service)
+
+async def get_document_controller(request: Request) -> DocumentController:
+    """Dependency to get the shared DocumentController created at startup."""
+    return request.app.state.document_controller
 
 
 @router.post(
     "/upload",
-    response_model=DocumentUploadResponse,
+    response_model=None,
     status_code=202,
     summary="Upload PDF document",
     description="Upload a PDF file for processing. Maximum size: 50MB.",
     responses={
-        202: {"description": "Upload successful, processing started"},
+        202: {"model": DocumentUploadResponse, "description": "Upload successful, processing started"},
         400: {"model": ErrorResponse, "description": "Invalid file"},
         413: {"model": ErrorResponse, "description": "File too large"},
         401: {"model": ErrorResponse, "description": "Unauthorized"}
@@ -74,59 +76,62 @@ async def upload_document(
 
 @router.get(
     "",
-    response_model=DocumentListResponse,
+    response_model=None,
     summary="List user's documents",
     description="Get all documents uploaded by the current user.",
     responses={
-        200: {"description": "Documents retrieved successfully"},
+        200: {"model": DocumentListResponse, "description": "Documents retrieved successfully"},
         401: {"model": ErrorResponse, "description": "Unauthorized"}
     }
 )
-def list_documents(
+async def list_documents(
     limit: int = Query(100, ge=1, le=100, description="Max results per page"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
     current_user: dict = Depends(get_current_user),
-    controller: DocumentController = Depends(get_document_controller)
+    service: DocumentService = Depends(get_document_service)
 ) -> DocumentListResponse:
     """
     List all documents for the authenticated user.
     
     Supports pagination via limit and offset parameters.
     """
-    return controller.handle_list(
-        user_id=current_user["id"],
-        limit=limit,
-        offset=offset
+    documents, total = await service.list_documents(current_user["id"], limit, offset)
+    
+    # Rows come straight from Postgres, so skip re-validating them
+    return DocumentListResponse.model_construct(
+        documents=[DocumentResponse.from_record(doc) for doc in documents],
+        total=total
     )
 
 
 @router.get(
     "/{document_id}",
-    response_model=DocumentResponse,
+    response_model=None,
     summary="Get document details",
     description="Retrieve details of a specific document.",
     responses={
-        200: {"description": "Document found"},
+        200: {"model": DocumentResponse, "description": "Document found"},
         404: {"model": ErrorResponse, "description": "Document not found"},
         401: {"model": ErrorResponse, "description": "Unauthorized"}
     }
 )
-def get_document(
+async def get_document(
     document_id: str,
     current_user: dict = Depends(get_current_user),
-    controller: DocumentController = Depends(get_document_controller)
+    service: DocumentService = Depends(get_document_service)
 ) -> DocumentResponse:
     """Get document by ID."""
-    return controller.handle_get(document_id, current_user["id"])
+    document = await service.get_document(document_id, current_user["id"])
+    return DocumentResponse.from_record(document)
 
 
 @router.delete(
     "/{document_id}",
-    response_model=DocumentDeleteResponse,
+    response_model=None,
     summary="Delete document",
     description="Delete a document and all associated data (chunks, embeddings).",
     responses={
-        200: {"description": "Document deleted"},
+        200: {"model": DocumentDeleteResponse, "description": "Document deleted"},
         404: {"model": ErrorResponse, "description": "Document not found"},
         401: {"model": ErrorResponse, "description": "Unauthorized"}
     }
@@ -144,26 +149,47 @@ async def delete_document(
     return await controller.handle_delete(document_id, current_user["id"])
 
 
+@router.post(
+    "/bulk-delete",
+    response_model=None,
+    summary="Delete several documents",
+    description="Delete up to 100 documents and their files in one request.",
+    responses={
+        200: {"model": BulkDeleteResponse, "description": "Documents deleted"},
+        401: {"model": ErrorResponse, "description": "Unauthorized"}
+    }
+)
+async def bulk_delete_documents(
+    request: BulkDeleteRequest,
+    current_user: dict = Depends(get_current_user),
+    controller: DocumentController = Depends(get_document_controller)
+) -> BulkDeleteResponse:
+    """
+    Delete several documents permanently.
+    
+    IDs that do not exist or belong to another user are skipped.
+    """
+    return await controller.handle_bulk_delete(
+        [str(document_id) for document_id in request.document_ids],
+        current_user["id"]
+    )
+
+
 @router.get(
     "/{document_id}/download",
     summary="Download document",
-    description="Download the original PDF file.",
+    description="Download the original PDF file via a short-lived signed URL.",
     responses={
         200: {"description": "File download", "content": {"application/pdf": {}}},
+        307: {"description": "Redirect to a signed storage URL"},
         404: {"model": ErrorResponse, "description": "Document not found"},
         401: {"model": ErrorResponse, "description": "Unauthorized"}
     }
 )
-def download_document(
+async def download_document(
     document_id: str,
     current_user: dict = Depends(get_current_user),
     controller: DocumentController = Depends(get_document_controller)
 ):
     """Download the original PDF file."""
-    file_bytes, filename = controller.handle_download(document_id, current_user["id"])
-    
-    return StreamingResponse(
-        io.BytesIO(file_bytes),
-        media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+    return await controller.handle_download(document_id, current_user["id"])
@@ -1,16 +1,39 @@
-from supabase import Client
+from supabase import AsyncClient
 from fastapi import HTTPException, status
 from typing import Dict, Any
+import jwt
 import logging
 
+from services.jwt_verifier import JWTVerifier
+from services.token_cache import TokenCache, token_cache
+
 logger = logging.getLogger(__name__)
 
+# Supabase Auth error codes -> (status code, detail) returned to the client
+_SIGNUP_ERRORS = {
+    "user_already_exists": (status.HTTP_400_BAD_REQUEST, "Email already registered"),
+    "email_exists": (status.HTTP_400_BAD_REQUEST, "Email already registered"),
+    "email_address_invalid": (status.HTTP_400_BAD_REQUEST, "Invalid email format"),
+    "weak_password": (status.HTTP_400_BAD_REQUEST, "Password does not meet requirements"),
+}
+
+_LOGIN_ERRORS = {
+    "invalid_credentials": (status.HTTP_401_UNAUTHORIZED, "Invalid email or password"),
+}
+
 
 class AuthService:
     """Handle authentication operations with Supabase Auth."""
     
-    def __init__(self, supabase_client: Client):
+    def __init__(
+        self,
+        supabase_client: AsyncClient,
+        verifier: JWTVerifier,
+        cache: TokenCache = token_cache
+    ):
         self.client = supabase_client
+        self.token_cache = cache
+        self.verifier = verifier
     
     async def signup(self, email: str, password: str) -> Dict[str, Any]:
         """
@@ -27,7 +50,7 @@ class AuthService:
             HTTPException: If signup fails
         """
         try:
-            response = self.client.auth.sign_up({
+            response = await self.client.auth.sign_up({
                 "email": email,
                 "password": password
             })
@@ -50,28 +73,11 @@ class AuthService:
         except Exception as e:
             logger.error("Signup failed")
             
-            # Handle specific Supabase errors
-            error_message = str(e)
-            if "already registered" in error_message.lower() or "already exists" in error_message.lower():
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered"
-                )
-            elif "invalid email" in error_message.lower():
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid email format"
-                )
-            elif "password" in error_message.lower():
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Password does not meet requirements"
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Failed to create account. Please try again."
-                )
+            status_code, detail = _SIGNUP_ERRORS.get(
+                getattr(e, "code", None),
+                (status.HTTP_500_INTERNAL_SERVER_ERROR, "Failed to create account. Please try again.")
+            )
+            raise HTTPException(status_code=status_code, detail=detail)
     
     async def login(self, email: str, password: str) -> Dict[str, Any]:
         """
@@ -88,7 +94,7 @@ class AuthService:
             HTTPException: If login fails
         """
         try:
-            response = self.client.auth.sign_in_with_password({
+            response = await self.client.auth.sign_in_with_password({
                 "email": email,
                 "password": password
             })
@@ -111,41 +117,67 @@ class AuthService:
         except Exception as e:
             logger.error("Login failed")
             
-            error_message = str(e)
-            if "invalid" in error_message.lower() or "credentials" in error_message.lower():
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid email or password"
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Login failed. Please try again."
-                )
+            status_code, detail = _LOGIN_ERRORS.get(
+                getattr(e, "code", None),
+                (status.HTTP_500_INTERNAL_SERVER_ERROR, "Login failed. Please try again.")
+            )
+            raise HTTPException(status_code=status_code, detail=detail)
     
     async def verify_token(self, token: str) -> Dict[str, Any]:
         """
         Verify JWT token.
         
+        Tokens are verified locally (HS256 with the project's JWT secret,
+        RS256/ES256 against its JWKS). Supabase is only asked when no local
+        key can check the signature. Verified tokens are cached briefly.
+        
         Args:
             token: JWT access token
             
         Returns:
-            dict: Keys: user
+            dict: Keys: user (dict with keys: id, email)
             
         Raises:
             HTTPException: If token invalid or expired
         """
+        cached_user = self.token_cache.get(token)
+        if cached_user is not None:
+            return {"user": cached_user}
+        
+        try:
+            claims = await self.verifier.verify(token)
+            user_data = {
+                "id": claims["sub"],
+                "email": claims.get("email")
+            }
+            self.token_cache.set(token, user_data)
+            return {"user": user_data}
+        except (jwt.InvalidSignatureError, jwt.PyJWKClientError) as e:
+            logger.debug("Local token verification failed, asking Supabase: %s", e)
+        except jwt.PyJWTError as e:
+            logger.debug("Token rejected: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token"
+            )
+        
         try:
-            response = self.client.auth.get_user(token)
+            response = await self.client.auth.get_user(token)
             
-            if not response.user:
+            if not response or not response.user:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid or expired token"
                 )
             
-            return {"user": response.user}
+            user = response.user
+            user_data = {
+                "id": user.id,
+                "email": user.email
+            }
+            self.token_cache.set(token, user_data)
+            
+            return {"user": user_data}
             
         except HTTPException:
             raise
@@ -164,13 +196,13 @@ class AuthService:
             refresh_token: JWT refresh token
             
         Returns:
-            dict: Keys: session
+            dict: Keys: session, user
             
         Raises:
             HTTPException: If refresh fails
         """
         try:
-            response = self.client.auth.refresh_session(refresh_token)
+            response = await self.client.auth.refresh_session(refresh_token)
             
             if not response.session:
                 raise HTTPException(
@@ -180,7 +212,10 @@ class AuthService:
             
             logger.info("Token refresh successful")
             
-            return {"session": response.session}
+            return {
+                "user": response.user,
+                "session": response.session
+            }
             
         except HTTPException:
             raise
@@ -199,7 +234,7 @@ class AuthService:
             token: JWT access token
         """
         try:
-            self.client.auth.sign_out()
+            await self.client.auth.sign_out()
             logger.info("User logout successful")
             
         except Exception as e:
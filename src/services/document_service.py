@@ -1,6 +1,9 @@
-from supabase import Client
+from supabase import AsyncClient
+from cachetools import TTLCache
 from fastapi import UploadFile, HTTPException, status
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, AsyncIterator
+import asyncio
+import httpx
 import logging
 
 from repositories.document_repository import DocumentRepository
@@ -10,14 +13,46 @@ from config.settings import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Read once from settings instead of on every request
+_BUCKET = settings.storage_bucket_name
+_MAX_MB = settings.max_file_size_mb
+_ALLOWED = frozenset(settings.allowed_mime_types)
+
+# Keep references to fire-and-forget tasks so they are not garbage
+# collected before they finish
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _on_cleanup_done(task: asyncio.Task) -> None:
+    """Forget a finished cleanup task and log it if it failed."""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Failed to remove orphaned upload from storage: %s", task.exception())
+
 
 class DocumentService:
     """Service for document management operations."""
     
-    def __init__(self, supabase: Client):
+    def __init__(self, supabase: AsyncClient, http_client: httpx.AsyncClient):
         self.supabase = supabase
+        self.http_client = http_client
         self.repository = DocumentRepository(supabase)
-        self.bucket_name = settings.storage_bucket_name
+        # Pages of each user's document list, keyed by (user_id, limit, offset);
+        # dropped whenever that user uploads or deletes a document
+        self._list_cache = TTLCache(maxsize=1024, ttl=settings.list_cache_ttl_seconds)
+        # Bumped on every invalidation so a list query that was in flight
+        # during an upload/delete does not store its stale page (one global
+        # counter, so nothing is kept per user)
+        self._list_generation = 0
+    
+    def _invalidate_list_cache(self, user_id: str) -> None:
+        """Drop all cached list pages for a user."""
+        self._list_generation += 1
+        for key in [key for key in self._list_cache if key[0] == user_id]:
+            self._list_cache.pop(key, None)
     
     async def upload_document(
         self,
@@ -41,10 +76,10 @@ class DocumentService:
         """
         try:
             # Validate file
-            FileValidator.validate_pdf(
+            await FileValidator.validate_pdf(
                 file,
-                max_size_mb=settings.max_file_size_mb,
-                allowed_types=settings.allowed_mime_types
+                max_size_mb=_MAX_MB,
+                allowed_types=_ALLOWED
             )
             
             # Generate storage path
@@ -53,18 +88,11 @@ class DocumentService:
                 file.filename
             )
             
-            # Read file content
-            file_content = await file.read()
-            
             # Upload to Supabase Storage
             try:
-                self.supabase.storage.from_(self.bucket_name).upload(
-                    path=storage_path,
-                    file=file_content,
-                    file_options={"content-type": "application/pdf"}
-                )
+                await self._store_file(file, storage_path)
             except Exception as storage_error:
-                logger.error(f"Storage upload failed: {str(storage_error)}")
+                logger.error("Storage upload failed: %s", storage_error)
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail="Failed to upload file to storage"
@@ -72,7 +100,7 @@ class DocumentService:
             
             # Create database record
             try:
-                document = self.repository.create(
+                document = await self.repository.create(
                     document_id=document_id,
                     user_id=user_id,
                     file_name=file.filename,
@@ -80,17 +108,20 @@ class DocumentService:
                     metadata=metadata
                 )
                 
-                logger.info(f"Document uploaded successfully: {document_id}")
+                self._invalidate_list_cache(user_id)
+                logger.info("Document uploaded successfully: %s", document_id)
                 return document
                 
             except Exception as db_error:
-               
-                try:
-                    self.supabase.storage.from_(self.bucket_name).remove([storage_path])
-                except:
-                    pass
+                # Remove the orphaned file in the background so the error
+                # response is not held up by another storage round-trip
+                task = asyncio.create_task(
+                    self.supabase.storage.from_(_BUCKET).remove([storage_path])
+                )
+                _background_tasks.add(task)
+                task.add_done_callback(_on_cleanup_done)
                 
-                logger.error(f"Database insert failed: {str(db_error)}")
+                logger.error("Database insert failed: %s", db_error)
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail="Failed to create document record"
@@ -99,13 +130,51 @@ class DocumentService:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Unexpected error during upload: {str(e)}")
+            logger.error("Unexpected error during upload: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Upload failed"
             )
     
-    def get_document(self, document_id: str, user_id: str) -> Dict[str, Any]:
+    async def _store_file(self, file: UploadFile, storage_path: str) -> None:
+        """
+        Upload the spooled file to storage without blocking the event loop.
+        
+        Small uploads are still in memory and are sent as bytes. Uploads
+        that spilled to a temp file are streamed in chunks, which
+        UploadFile reads in a worker thread.
+        """
+        if not getattr(file.file, "_rolled", True):
+            await self.supabase.storage.from_(_BUCKET).upload(
+                path=storage_path,
+                file=await file.read(),
+                file_options={"content-type": "application/pdf"}
+            )
+            return
+        
+        # storage3 only accepts bytes or file objects, so stream the body
+        # to the Storage REST API directly
+        headers = {
+            **self.supabase.options.headers,
+            "content-type": "application/pdf",
+            "x-upsert": "false"
+        }
+        if file.size is not None:
+            headers["content-length"] = str(file.size)
+        
+        response = await self.http_client.post(
+            f"{self.supabase.storage_url}object/{_BUCKET}/{storage_path}",
+            content=self._iter_upload(file),
+            headers=headers
+        )
+        response.raise_for_status()
+    
+    @staticmethod
+    async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+    
+    async def get_document(self, document_id: str, user_id: str) -> Dict[str, Any]:
         """
         Get document by ID.
         
@@ -119,7 +188,7 @@ class DocumentService:
         Raises:
             HTTPException: If not found
         """
-        document = self.repository.get_by_id(document_id, user_id)
+        document = await self.repository.get_by_id(document_id, user_id)
         
         if not document:
             raise HTTPException(
@@ -129,7 +198,7 @@ class DocumentService:
         
         return document
     
-    def list_documents(
+    async def list_documents(
         self,
         user_id: str,
         limit: int = 100,
@@ -146,7 +215,19 @@ class DocumentService:
         Returns:
             Tuple of (documents, total_count)
         """
-        return self.repository.list_by_user(user_id, limit, offset)
+        key = (user_id, limit, offset)
+        cached = self._list_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        generation = self._list_generation
+        documents, total = await self.repository.list_by_user(user_id, limit, offset)
+        
+        # Empty pages are cheap to fetch and may come from a failed query
+        if documents and self._list_generation == generation:
+            self._list_cache[key] = (documents, total)
+        
+        return documents, total
     
     async def delete_document(self, document_id: str, user_id: str) -> bool:
         """
@@ -162,49 +243,158 @@ class DocumentService:
         Raises:
             HTTPException: If not found or deletion fails
         """
-        document = self.get_document(document_id, user_id)
+        document = await self.get_document(document_id, user_id)
         
-        try:
-            self.supabase.storage.from_(self.bucket_name).remove([document["bucket_path"]])
-        except Exception as e:
-            logger.warning(f"Failed to delete file from storage: {str(e)}")
+        # The file and the record are independent, so remove both at once
+        storage_result, success = await asyncio.gather(
+            self.supabase.storage.from_(_BUCKET).remove([document["bucket_path"]]),
+            self.repository.delete(document_id, user_id),
+            return_exceptions=True
+        )
         
-        success = self.repository.delete(document_id, user_id)
+        if isinstance(storage_result, Exception):
+            logger.warning("Failed to delete file from storage: %s", storage_result)
         
-        if not success:
+        if success is not True:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to delete document"
             )
         
-        logger.info(f"Document deleted: {document_id}")
+        self._invalidate_list_cache(user_id)
+        logger.info("Document deleted: %s", document_id)
         return True
     
-    def download_document(self, document_id: str, user_id: str) -> bytes:
+    async def delete_many(self, document_ids: list[str], user_id: str) -> list[str]:
         """
-        Download document file.
+        Delete several documents (files + database records) at once.
+        
+        Uses one query to look up the files, one storage call and one
+        delete query, however many documents are given.
+        
+        Args:
+            document_ids: Document UUIDs
+            user_id: User UUID
+            
+        Returns:
+            IDs of the deleted documents (unknown IDs are skipped)
+        """
+        try:
+            paths = await self.repository.list_paths_by_ids(document_ids, user_id)
+        except Exception:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to delete documents"
+            )
+        
+        if not paths:
+            return []
+        
+        storage_result, deleted = await asyncio.gather(
+            self.supabase.storage.from_(_BUCKET).remove(list(paths.values())),
+            self.repository.delete_many(list(paths), user_id),
+            return_exceptions=True
+        )
+        
+        if isinstance(storage_result, Exception):
+            logger.warning("Failed to delete files from storage: %s", storage_result)
+        
+        if isinstance(deleted, Exception) or not deleted:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to delete documents"
+            )
+        
+        self._invalidate_list_cache(user_id)
+        logger.info("Documents deleted: %d", len(deleted))
+        return deleted
+    
+    async def create_download_url(
+        self,
+        document_id: str,
+        user_id: str,
+        expires_in: int = 60
+    ) -> str:
+        """
+        Create a short-lived signed URL for downloading a document file.
         
         Args:
             document_id: Document UUID
             user_id: User UUID
+            expires_in: URL lifetime in seconds
             
         Returns:
-            File bytes
+            Signed storage URL
+            
+        Raises:
+            HTTPException: If not found or URL creation fails
+        """
+        document = await self.get_document(document_id, user_id)
+        
+        try:
+            signed = await self.supabase.storage.from_(_BUCKET).create_signed_url(
+                document["bucket_path"],
+                expires_in=expires_in,
+                options={"download": document["file_name"]}
+            )
+            return signed["signedURL"]
+            
+        except Exception as e:
+            logger.error("Failed to create download URL: %s", e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to download file"
+            )
+    
+    async def stream_download(
+        self,
+        document_id: str,
+        user_id: str
+    ) -> tuple[AsyncIterator[bytes], str]:
+        """
+        Open a streaming download of a document file.
+        
+        The storage request is started before returning so that a missing
+        file or storage error is reported before any bytes are sent.
+        
+        Args:
+            document_id: Document UUID
+            user_id: User UUID
+            
+        Returns:
+            Tuple of (file chunk iterator, filename)
             
         Raises:
             HTTPException: If not found or download fails
         """
-        document = self.get_document(document_id, user_id)
+        document = await self.get_document(document_id, user_id)
         
         try:
-            file_bytes = self.supabase.storage.from_(self.bucket_name).download(
-                document["bucket_path"]
+            signed = await self.supabase.storage.from_(_BUCKET).create_signed_url(
+                document["bucket_path"],
+                expires_in=settings.signed_url_expires_seconds
             )
-            return file_bytes
+            request = self.http_client.build_request("GET", signed["signedURL"])
+            response = await self.http_client.send(request, stream=True)
+            
+            if response.is_error:
+                await response.aclose()
+                raise Exception(f"Storage returned HTTP {response.status_code}")
             
         except Exception as e:
-            logger.error(f"Failed to download file: {str(e)}")
+            logger.error("Failed to download file: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to download file"
             )
+        
+        return self._iter_response(response), document["file_name"]
+    
+    @staticmethod
+    async def _iter_response(response: httpx.Response) -> AsyncIterator[bytes]:
+        """Yield a streamed storage response in fixed-size chunks."""
+        try:
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                yield chunk
+        finally:
+            await response.aclose()
@@ -0,0 +1,145 @@
+import jwt
+from typing import Dict, Any, Optional
+import asyncio
+import httpx
+import logging
+import time
+
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Supabase JWT secrets are at least 32 characters; anything shorter (or an
+# example placeholder) must never be trusted to sign tokens
+MIN_JWT_SECRET_LENGTH = 32
+_PLACEHOLDER_MARKERS = ("your_", "_here", "changeme")
+
+
+def _usable_jwt_secret(secret: Optional[str]) -> Optional[str]:
+    if not secret:
+        return None
+    lowered = secret.lower()
+    if len(secret) < MIN_JWT_SECRET_LENGTH or any(m in lowered for m in _PLACEHOLDER_MARKERS):
+        logger.warning("Ignoring SUPABASE_JWT_SECRET: too short or a placeholder; HS256 tokens will be verified by Supabase")
+        return None
+    return secret
+
+
+class JWTVerifier:
+    """
+    Verify Supabase access tokens locally.
+
+    HS256 tokens are checked with the project's JWT secret (when
+    configured); asymmetric tokens against the project's JWKS, which is
+    fetched asynchronously on the shared HTTP client.
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        http_client: httpx.AsyncClient,
+        jwt_secret: Optional[str] = None,
+        audience: str = "authenticated",
+        jwks_cache_ttl: int = 600,
+        min_refresh_interval: int = 30
+    ):
+        self.jwks_url = jwks_url
+        self.http_client = http_client
+        self.jwt_secret = _usable_jwt_secret(jwt_secret)
+        self.audience = audience
+        self.jwks_cache_ttl = jwks_cache_ttl
+        # Unknown kids can be sent by anyone, so they may trigger at most
+        # one JWKS fetch per min_refresh_interval seconds
+        self.min_refresh_interval = min_refresh_interval
+        self._keys: Dict[str, jwt.PyJWK] = {}
+        # Last successful fetch (key freshness) vs. last attempt (rate limit)
+        self._fetched_at = float("-inf")
+        self._attempted_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def verify(self, token: str) -> Dict[str, Any]:
+        """
+        Verify token signature, expiry and audience.
+
+        Args:
+            token: JWT access token
+
+        Returns:
+            Decoded token claims
+
+        Raises:
+            jwt.PyJWTError: If the token is invalid or cannot be verified
+                locally (jwt.InvalidSignatureError / jwt.PyJWKClientError
+                when no local key matches it)
+        """
+        options = {"require": ["exp", "sub"]}
+        header = jwt.get_unverified_header(token)
+
+        if header.get("alg") == "HS256":
+            if not self.jwt_secret:
+                raise jwt.PyJWKClientError("No JWT secret configured for HS256 tokens")
+            return jwt.decode(
+                token,
+                self.jwt_secret,
+                algorithms=["HS256"],
+                audience=self.audience,
+                options=options
+            )
+
+        kid = header.get("kid")
+        if not kid:
+            raise jwt.PyJWKClientError("Token header has no kid")
+
+        signing_key = await self._get_signing_key(kid)
+        return jwt.decode(
+            token,
+            signing_key.key,
+            algorithms=["RS256", "ES256"],
+            audience=self.audience,
+            options=options
+        )
+
+    async def _get_signing_key(self, kid: str) -> jwt.PyJWK:
+        key = self._keys.get(kid)
+        if key is not None and time.monotonic() - self._fetched_at < self.jwks_cache_ttl:
+            return key
+
+        # Refresh when the key set expired or the kid is unknown, but never
+        # more often than min_refresh_interval (concurrent callers share one fetch)
+        if time.monotonic() - self._attempted_at >= self.min_refresh_interval:
+            async with self._lock:
+                if time.monotonic() - self._attempted_at >= self.min_refresh_interval:
+                    try:
+                        await self.refresh_keys()
+                    except (httpx.HTTPError, jwt.PyJWKSetError, ValueError) as e:
+                        # Keep serving the previous keys; retry after the interval
+                        logger.warning("Could not refresh JWKS: %s", e)
+            key = self._keys.get(kid)
+
+        if key is None:
+            raise jwt.PyJWKClientError(f'Unable to find a signing key that matches "{kid}"')
+        return key
+
+    async def refresh_keys(self) -> None:
+        """Fetch the JWK set and replace the cached signing keys."""
+        self._attempted_at = time.monotonic()
+        response = await self.http_client.get(self.jwks_url)
+        response.raise_for_status()
+        jwk_set = jwt.PyJWKSet.from_dict(response.json())
+        self._keys = {key.key_id: key for key in jwk_set.keys if key.key_id}
+        self._fetched_at = time.monotonic()
+
+
+def build_jwt_verifier(http_client: httpx.AsyncClient) -> JWTVerifier:
+    """Create the verifier for this project's tokens on the shared HTTP client."""
+    return JWTVerifier(
+        jwks_url=f"{str(settings.api_keys.supabase_url).rstrip('/')}/auth/v1/.well-known/jwks.json",
+        http_client=http_client,
+        jwt_secret=(
+            settings.api_keys.supabase_jwt_secret.get_secret_value()
+            if settings.api_keys.supabase_jwt_secret else None
+        ),
+        jwks_cache_ttl=settings.jwks_cache_ttl_seconds,
+        min_refresh_interval=settings.jwks_min_refresh_seconds
+    )
@@ -0,0 +1,82 @@
+from cachetools import TLRUCache
+from typing import Dict, Any, Optional
+import base64
+import hashlib
+import json
+import logging
+import time
+
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def get_token_expiry(token: str) -> Optional[float]:
+    """
+    Read the `exp` claim of a JWT without verifying its signature.
+
+    Only used to bound how long a token that Supabase already verified
+    may stay cached; never to trust the token itself.
+
+    Args:
+        token: JWT access token
+
+    Returns:
+        Expiry as a UNIX timestamp, or None if it cannot be read
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenCache:
+    """In-process cache mapping verified access tokens to user data."""
+
+    def __init__(self, maxsize: int = 10_000, max_ttl: float = 60):
+        self.max_ttl = max_ttl
+        # Each entry expires with its token or after max_ttl, whichever
+        # comes first (value is (user, expires_at))
+        self._cache = TLRUCache(
+            maxsize=maxsize,
+            ttu=lambda _key, value, _now: value[1],
+            timer=time.time
+        )
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached user data for a token.
+
+        Args:
+            token: JWT access token
+
+        Returns:
+            User data if the token is cached and not expired, None otherwise
+        """
+        entry = self._cache.get(self._key(token))
+        return entry[0] if entry else None
+
+    def set(self, token: str, user: Dict[str, Any]) -> None:
+        """
+        Cache user data for a verified token for up to max_ttl seconds.
+
+        Args:
+            token: JWT access token
+            user: User data to cache
+        """
+        expires_at = get_token_expiry(token)
+        if expires_at is None:
+            logger.debug("Token has no readable exp claim, not caching")
+            return
+
+        expires_at = min(expires_at, time.time() + self.max_ttl)
+        self._cache[self._key(token)] = (user, expires_at)
+
+
+token_cache = TokenCache(max_ttl=get_settings().token_cache_ttl_seconds)
@@ -1,53 +1,41 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from supabase import Client
 from typing import Dict, Any, Optional
 import logging
 
-from db.supabase_client import db
 from services.auth_service import AuthService
 
 logger = logging.getLogger(__name__)
 
 security = HTTPBearer(auto_error=False)
 
-
-def get_supabase_client() -> Client:
-    """
-    Get Supabase client instance.
-    
-    Returns:
-        Client: Supabase client for database operations
-    """
-    return db
+MIN_TOKEN_LENGTH = 20
+MAX_TOKEN_LENGTH = 4096
 
 
-def get_auth_service(supabase: Client = Depends(get_supabase_client)) -> AuthService:
+async def get_auth_service(request: Request) -> AuthService:
     """
-    Get AuthService instance.
+    Get the shared AuthService created at startup.
     
-    Args:
-        supabase: Supabase client
-        
     Returns:
         AuthService: Service for authentication operations
     """
-    return AuthService(supabase)
+    return request.app.state.auth_service
 
 
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    supabase: Client = Depends(get_supabase_client)
+    auth_service: AuthService = Depends(get_auth_service)
 ) -> Dict[str, Any]:
     """
     Validate JWT token and return authenticated user information.
     
     Args:
         credentials: Bearer token from Authorization header
-        supabase: Supabase client instance
+        auth_service: Service used to verify the token (cached per token)
         
     Returns:
-        dict: User data with keys: id, email, created_at
+        dict: User data with keys: id, email
         
     Raises:
         HTTPException: 401 if token is missing, invalid, or expired
@@ -59,27 +47,26 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"}
         )
     
+    token = credentials.credentials
+    
+    # A JWT is three dot-separated segments; reject anything else up front
+    if token.count(".") != 2 or not (MIN_TOKEN_LENGTH < len(token) < MAX_TOKEN_LENGTH):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    
     try:
-        token = credentials.credentials
-        response = supabase.auth.get_user(token)
-        
-        if not response or not response.user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired token",
-                headers={"WWW-Authenticate": "Bearer"}
-            )
-        
-        user = response.user
-        
-        return {
-            "id": user.id,
-            "email": user.email,
-            "created_at": user.created_at if hasattr(user, 'created_at') else None
-        }
+        result = await auth_service.verify_token(token)
+        return result["user"]
         
-    except HTTPException:
-        raise
+    except HTTPException as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=e.detail,
+            headers={"WWW-Authenticate": "Bearer"}
+        )
     except Exception as e:
         logger.error("Token validation failed")
         raise HTTPException(
@@ -91,19 +78,19 @@ async def get_current_user(
 
 async def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    supabase: Client = Depends(get_supabase_client)
+    auth_service: AuthService = Depends(get_auth_service)
 ) -> Optional[Dict[str, Any]]:
     """
     Optional authentication - returns user if authenticated, None otherwise.
     
     Args:
         credentials: Bearer token from Authorization header
-        supabase: Supabase client instance
+        auth_service: Service used to verify the token
         
     Returns:
         dict: User data if authenticated, None if not
     """
     try:
-        return await get_current_user(credentials, supabase)
+        return await get_current_user(credentials, auth_service)
     except HTTPException:
         return None
@@ -2,16 +2,23 @@ from fastapi import UploadFile, HTTPException, status
 import re
 import uuid
 from pathlib import Path
+from typing import Collection
+
+_FILENAME_SANITIZE_RE = re.compile(r'[^\w\s\-.]')
+_PDF_EXTS = ('.pdf',)
+
+# Every PDF starts with this header
+PDF_MAGIC = b"%PDF-"
 
 
 class FileValidator:
     """Utility class for file validation."""
     
     @staticmethod
-    def validate_pdf(
+    async def validate_pdf(
         file: UploadFile,
         max_size_mb: int = 5,
-        allowed_types: list[str] = ["application/pdf"]
+        allowed_types: Collection[str] = ("application/pdf",)
     ) -> None:
         """
         Validate uploaded PDF file.
@@ -39,19 +46,17 @@ class FileValidator:
             )
         
         # Check file extension
-        if not file.filename.lower().endswith('.pdf'):
+        if not file.filename.lower().endswith(_PDF_EXTS):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="File must have .pdf extension"
             )
         
-        # Check file size
-        file.file.seek(0, 2)  # Seek to end
-        size_bytes = file.file.tell()
-        file.file.seek(0)  # Reset to beginning
+        # Check file size (Starlette records it while parsing the form)
+        size_bytes = file.size
         
         max_size_bytes = max_size_mb * 1024 * 1024
-        if size_bytes > max_size_bytes:
+        if size_bytes is not None and size_bytes > max_size_bytes:
             raise HTTPException(
                 status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
                 detail=f"File too large. Maximum size: {max_size_mb}MB"
@@ -63,6 +68,15 @@ class FileValidator:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="File is empty"
             )
+        
+        # Check the content really is a PDF (content type is client-supplied)
+        head = await file.read(len(PDF_MAGIC))
+        await file.seek(0)
+        if head != PDF_MAGIC:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File is not a valid PDF"
+            )
     
     @staticmethod
     def sanitize_filename(filename: str) -> str:
@@ -77,7 +91,7 @@ class FileValidator:
         """
         filename = Path(filename).name
         
-        filename = re.sub(r'[^\w\s\-\.]', '', filename)
+        filename = _FILENAME_SANITIZE_RE.sub('', filename)
         
         if len(filename) > 255:
             name, ext = filename.rsplit('.', 1)
@@ -0,0 +1,39 @@
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Room for the multipart boundaries, part headers and the metadata field
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject oversized uploads from their Content-Length header.
+
+    Runs before the multipart body is read, so a too-large request is
+    answered with 413 without receiving any of its bytes.
+    """
+
+    def __init__(self, app: ASGIApp, path: str, max_size_mb: int):
+        self.app = app
+        self.path = path
+        self.max_size_mb = max_size_mb
+        self.max_body_bytes = max_size_mb * 1024 * 1024 + MULTIPART_OVERHEAD_BYTES
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["method"] == "POST"
+            and scope["path"] == self.path
+        ):
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_body_bytes:
+                        response = ORJSONResponse(
+                            {"detail": f"File too large. Maximum size: {self.max_size_mb}MB"},
+                            status_code=413
+                        )
+                        await response(scope, receive, send)
+                        return
+                    break
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,7 @@
+-- Serve list_by_user (filter on user_id, order by created_at desc, paged
+-- with range() and count="exact") from a single index walk instead of
+-- filtering and sorting all of a user's rows. Each page fetches at most
+-- 100 heap rows, so no columns are INCLUDEd (metadata is unbounded jsonb
+-- and would not fit in an index tuple).
+create index if not exists documents_user_created_idx
+    on public.documents (user_id, created_at desc);